@@ -1,4 +1,4 @@
-from utils.data_loading import prepare_cvd_datasets
+from utils.data_loading import prepare_cvd_datasets_memoized
 
 # Setting up the constants
 FILES = ['cleveland.data', 'hungarian.data', 'switzerland.data', 'va.data']
@@ -9,7 +9,8 @@ COLUMN_NAMES = ["Age", "Sex", "Chest Pain", "Rest BP", "Chol", "FBS",
                 "Ca", "Thal", "CVD Class"]
 
 # We'll make the datasets global so that they can be loaded into all notebooks
-dfs, df_combined = prepare_cvd_datasets(
+# (memoized in utils.data_loading, so reloading this module reuses the same datasets)
+dfs, df_combined = prepare_cvd_datasets_memoized(
     files=FILES, 
     dataset_names=DATASET_NAMES,
     column_names=COLUMN_NAMES, 
@@ -11,10 +11,8 @@ def write_md_cell(id, header, content):
     
     # 3. Process the content into a markdown list
     # .splitlines() handles different newline characters automatically
-    list_items = ""
-    for item in content.splitlines():
-        if item.strip():  # Only add if the line isn't empty
-            list_items += f"- {item.strip()}\n"
+    list_items = "".join(f"- {item.strip()}\n" for item in content.splitlines() 
+                            if item.strip())  # Only add if the line isn't empty
             
     output = f"{anchor}\n{header_text}\n{list_items}"
     return output
@@ -22,113 +20,83 @@ def write_md_cell(id, header, content):
 def make_toc_item(id:str, header:str, index) -> str:
     return f"{int(index)}. ({header.strip().title()})[#{id.strip()}]\n"
 
-notebook_cells = [""" 
-introduction;
-Introduction;d
-
-Reference to Notebooks 1 & 2
-Objectives
-Research questions""",
-
-"""
-setup-and-data-loading;
-Setup & Data Loading;
-
-Import libraries
-Load cleaned dataset from Notebook 2
-Verify data quality and completeness
-""",
-"""
-dataset-overview;
-Dataset Overview;
-
-Final sample size
-Target variable distribution
-Summary statistics
-""",
-"""
-univariate-analysis;
-Univariate Analysis;
-
-Distribution of each predictor variable
-Identify skewness, outliers
-Check for transformations needed
-Visualizations: histograms, box plots
-
-
-Identify which variables are consistent vs. population-specific
-""",
-"""
-target-variable-relationships;
-Target Variable Relationships;
-
-For each predictor:
-
-Relationship with heart disease severity
-Visualization (box plots for categorical, scatter/violin for continuous)
-Statistical significance
-
-
-Rank variables by apparent association strength
-""", 
-"""
-correlation-analysis;
-Correlation Analysis;
-
-Correlation matrix (for continuous variables)
-Identify multicollinearity issues
-Visualization: heatmap
-""",
-"""
-bivariate-relationships;
-Bivariate Relationships;
-
-Key predictor pairs
-Interaction effects
-Conditional relationships
-""",
-"""
-feature-engineering-ideas;
-Feature Engineering Ideas;
-
-Potential transformations (log, polynomial, binning)
-Interaction terms to create
-Domain-knowledge based features
-Rationale for each""", 
-"""
-conclusions-and-modeling-preview;
-Conclusions & Modeling Preview;
-
-Top features associated with heart disease
-Hypotheses for modeling
-Summary of exploratory findings
-Expected important features
-Transition to modeling phase
-"""]
-
-def write_to_stream(formatted_content, file_path, mode='a'):
+NOTEBOOK_CELLS: list[tuple[str, str, str]] = [
+    ("introduction",
+     "Introduction",
+     "Reference to Notebooks 1 & 2\n"
+     "Objectives\n"
+     "Research questions"),
+    ("setup-and-data-loading",
+     "Setup & Data Loading",
+     "Import libraries\n"
+     "Load cleaned dataset from Notebook 2\n"
+     "Verify data quality and completeness"),
+    ("dataset-overview",
+     "Dataset Overview",
+     "Final sample size\n"
+     "Target variable distribution\n"
+     "Summary statistics"),
+    ("univariate-analysis",
+     "Univariate Analysis",
+     "Distribution of each predictor variable\n"
+     "Identify skewness, outliers\n"
+     "Check for transformations needed\n"
+     "Visualizations: histograms, box plots\n"
+     "Identify which variables are consistent vs. population-specific"),
+    ("target-variable-relationships",
+     "Target Variable Relationships",
+     "For each predictor:\n"
+     "Relationship with heart disease severity\n"
+     "Visualization (box plots for categorical, scatter/violin for continuous)\n"
+     "Statistical significance\n"
+     "Rank variables by apparent association strength"),
+    ("correlation-analysis",
+     "Correlation Analysis",
+     "Correlation matrix (for continuous variables)\n"
+     "Identify multicollinearity issues\n"
+     "Visualization: heatmap"),
+    ("bivariate-relationships",
+     "Bivariate Relationships",
+     "Key predictor pairs\n"
+     "Interaction effects\n"
+     "Conditional relationships"),
+    ("feature-engineering-ideas",
+     "Feature Engineering Ideas",
+     "Potential transformations (log, polynomial, binning)\n"
+     "Interaction terms to create\n"
+     "Domain-knowledge based features\n"
+     "Rationale for each"),
+    ("conclusions-and-modeling-preview",
+     "Conclusions & Modeling Preview",
+     "Top features associated with heart disease\n"
+     "Hypotheses for modeling\n"
+     "Summary of exploratory findings\n"
+     "Expected important features\n"
+     "Transition to modeling phase"),
+]
+
+def write_to_stream(formatted_content, stream):
     """
-    Writes the formatted string to a specified file.
+    Writes the formatted string to an already open file.
     
     Args:
         formatted_content (str): The output from your write_md_cell function.
-        file_path (str): The name or path of the .ipynb or .md file.
-        mode (str): 'a' for append (default) or 'w' to overwrite.
+        stream (file object): The open .ipynb or .md file to write to.
     """
-    try:
-        with open(file_path, mode, encoding='utf-8') as f:
-            f.write(formatted_content + "\n")
-        print(f"Successfully wrote to {file_path}")
-    except Exception as e:
-        print(f"An error occurred: {e}")
+    stream.write(formatted_content + "\n")
 
 filepath="notebook_stream.txt"
 toc_string = ""
 
-for index, cell_content in enumerate(notebook_cells):
-    id, header, content = cell_content.split(";")
-    cell = write_md_cell(id, header, content)
-    toc_string += make_toc_item(id, header, index+1)
-    write_to_stream(cell, file_path=filepath)
-
-write_to_stream(toc_string, file_path=filepath)
\ No newline at end of file
+# Open the output file once for all of the cells and the table of contents
+try:
+    with open(filepath, 'w', encoding='utf-8') as f:
+        for index, (id, header, content) in enumerate(NOTEBOOK_CELLS):
+            cell = write_md_cell(id, header, content)
+            toc_string += make_toc_item(id, header, index+1)
+            write_to_stream(cell, f)
+
+        write_to_stream(toc_string, f)
+    print(f"Successfully wrote to {filepath}")
+except Exception as e:
+    print(f"An error occurred: {e}")
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""
+Checks of the Parquet cache of utils/data_loading.py
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import utils.data_loading as data_loading
+
+pytest.importorskip("pyarrow")
+
+FILES = ['a.data', 'b.data']
+DATASET_NAMES = ['A', 'B']
+COLUMN_NAMES = ["Age", "Sex", "Chest Pain", "Rest BP", "Chol", "FBS",
+                "Rest ECG", "Max HR", "Ex Angina", "Oldpeak", "Slope",
+                "Ca", "Thal", "CVD Class"]
+ROWS = [
+    "63.0,1.0,1.0,145.0,233.0,1.0,2.0,150.0,0.0,2.3,3.0,0.0,6.0,0",
+    "67.0,1.0,4.0,160.0,?,0.0,2.0,108.0,1.0,1.5,2.0,3.0,3.0,2",
+    "37.0,0.0,3.0,130.0,250.0,0.0,0.0,187.0,0.0,3.5,?,0.0,3.0,0",
+]
+
+
+@pytest.fixture
+def data_directory(tmp_path):
+    """Two small raw files in the UCI layout (no header, "?" for missing values)."""
+    for name in FILES:
+        (tmp_path / f"processed.{name}").write_text("\n".join(ROWS) + "\n")
+    return str(tmp_path)
+
+
+@pytest.fixture
+def load_calls(monkeypatch):
+    """Count the calls that parse the raw files, i.e. the cache misses."""
+    calls = []
+    load_datasets = data_loading.load_datasets
+
+    def counting_load_datasets(*args, **kwargs):
+        calls.append(args)
+        return load_datasets(*args, **kwargs)
+
+    monkeypatch.setattr(data_loading, 'load_datasets', counting_load_datasets)
+    return calls
+
+
+def prepare(directory, column_names=COLUMN_NAMES):
+    return data_loading.prepare_cvd_datasets(FILES, DATASET_NAMES, column_names, directory=directory)
+
+
+def test_cache_hit_after_first_load(data_directory, load_calls):
+    dfs, df_combined = prepare(data_directory)
+    cached_dfs, cached_combined = prepare(data_directory)
+    assert len(load_calls) == 1
+    assert cached_combined.equals(df_combined)
+    assert list(cached_combined.dtypes) == list(df_combined.dtypes)
+    assert data_loading.load_combined(FILES, DATASET_NAMES, COLUMN_NAMES, directory=data_directory).shape == (6, 15)
+    assert len(load_calls) == 1
+
+
+def test_cache_invalidated_by_version_parameters_and_sources(data_directory, load_calls, monkeypatch):
+    prepare(data_directory)
+
+    # Another pipeline version
+    monkeypatch.setattr(data_loading, 'CACHE_VERSION', data_loading.CACHE_VERSION + 1)
+    prepare(data_directory)
+    assert len(load_calls) == 2
+
+    # Other call parameters
+    data_loading.prepare_cvd_datasets(FILES, DATASET_NAMES[::-1], COLUMN_NAMES, directory=data_directory)
+    assert len(load_calls) == 3
+
+    # A raw file newer than the cache
+    prepare(data_directory)
+    assert len(load_calls) == 4
+    cache_directory = os.path.join(data_directory, "_cache")
+    older = os.path.getmtime(os.path.join(data_directory, "processed.a.data")) - 10
+    for name in os.listdir(cache_directory):
+        os.utime(os.path.join(cache_directory, name), (older, older))
+    prepare(data_directory)
+    assert len(load_calls) == 5
+    prepare(data_directory)
+    assert len(load_calls) == 5
+
+
+def test_cache_write_failure_does_not_fail_loading(data_directory, load_calls):
+    # A file where the cache directory should be makes every cache write fail
+    with open(os.path.join(data_directory, "_cache"), "w") as file:
+        file.write("")
+
+    with pytest.warns(UserWarning):
+        dfs, df_combined = prepare(data_directory)
+    assert len(dfs) == 2
+    assert df_combined.shape == (6, 15)
+
+
+def test_out_of_level_codes_warn_before_becoming_missing():
+    dataframe = pd.DataFrame({'Sex': [0.0, 1.0, 2.0, np.nan], 'Thal': [3.0, 6.0, 7.0, 7.0]})
+    with pytest.warns(UserWarning, match="'Sex'"):
+        df_categorical = data_loading.convert_categorical_columns(dataframe)
+    assert df_categorical['Sex'].isna().sum() == 2
+    assert df_categorical['Thal'].notna().all()
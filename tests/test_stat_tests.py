@@ -0,0 +1,236 @@
+"""
+Equivalence checks of the hand-written tests in utils/stat_tests.py against scipy.stats
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import chi2_contingency, f_oneway, kruskal
+
+import utils.stat_tests as stat_tests
+
+RTOL = 1e-9
+
+
+@pytest.fixture(params=[True, False], ids=['numba', 'numpy'])
+def use_numba(request, monkeypatch):
+    """Run a test with the numba kernels and with the NumPy fallback."""
+    if request.param and not stat_tests.HAS_NUMBA:
+        pytest.skip("numba is not installed")
+    monkeypatch.setattr(stat_tests, 'HAS_NUMBA', request.param)
+    return request.param
+
+
+def make_groups(rng, n_groups, n_per_group=40, n_levels=8):
+    """Integer valued observations (many ties) and their group codes."""
+    values = rng.integers(0, n_levels, n_groups * n_per_group).astype(np.float64)
+    codes = np.repeat(np.arange(n_groups), n_per_group)
+    return values, codes
+
+
+@pytest.mark.parametrize('n_groups', [2, 3, 5])
+def test_kruskal_matches_scipy(use_numba, n_groups):
+    rng = np.random.default_rng(n_groups)
+    for _ in range(10):
+        values, codes = make_groups(rng, n_groups)
+        statistic, p_value = stat_tests._kruskal_wallis(values, codes)
+        expected = kruskal(*[values[codes == g] for g in range(n_groups)])
+        assert statistic == pytest.approx(expected.statistic, rel=RTOL)
+        assert p_value == pytest.approx(expected.pvalue, rel=RTOL)
+
+
+def test_kruskal_identical_values_raises(use_numba):
+    with pytest.raises(ValueError):
+        stat_tests._kruskal_wallis(np.ones(10), np.repeat([0, 1], 5))
+    with pytest.raises(ValueError):
+        stat_tests._kruskal_wallis(np.ones(9), np.repeat([0, 1, 2], 3))
+
+
+@pytest.mark.parametrize('n_groups', [2, 4])
+def test_anova_matches_scipy(n_groups):
+    rng = np.random.default_rng(n_groups)
+    values = rng.normal(100, 15, n_groups * 30)
+    codes = np.repeat(np.arange(n_groups), 30)
+    statistic, p_value = stat_tests._one_way_anova(values, codes)
+    expected = f_oneway(*[values[codes == g] for g in range(n_groups)])
+    assert statistic == pytest.approx(expected.statistic, rel=RTOL)
+    assert p_value == pytest.approx(expected.pvalue, rel=RTOL)
+
+
+@pytest.mark.parametrize('shape', [(2, 2), (2, 3), (3, 4)])
+def test_chi_square_matches_scipy(shape):
+    rng = np.random.default_rng(sum(shape))
+    contingency = rng.integers(1, 30, shape)
+    result = stat_tests._chi_square_result(contingency, 'a', 'b')
+    # Yates correction applies to the 2x2 (dof=1) table
+    chi2, p_value, dof, _ = chi2_contingency(contingency)
+    assert result.statistic == pytest.approx(chi2, rel=RTOL)
+    assert result.p_value == pytest.approx(p_value, rel=RTOL)
+    assert result.dof == dof
+
+
+def test_chi_square_drops_unobserved_levels():
+    contingency = np.array([[10, 0, 5], [0, 0, 0], [3, 0, 12]])
+    result = stat_tests._chi_square_result(contingency, 'a', 'b')
+    chi2, p_value, dof, _ = chi2_contingency(np.array([[10, 5], [3, 12]]))
+    assert result.statistic == pytest.approx(chi2, rel=RTOL)
+    assert result.p_value == pytest.approx(p_value, rel=RTOL)
+    assert result.dof == dof == 1
+
+
+def test_categorical_independence_skips_missing():
+    rng = np.random.default_rng(0)
+    values1 = rng.choice(np.array(['x', 'y', 'z', None], dtype=object), 300)
+    values2 = rng.choice(np.array([1.0, 2.0, np.nan]), 300)
+    result = stat_tests.test_categorical_independence_arr(values1, values2)
+    expected = chi2_contingency(pd.crosstab(values1, values2).to_numpy())
+    assert result.statistic == pytest.approx(expected[0], rel=RTOL)
+    assert result.p_value == pytest.approx(expected[1], rel=RTOL)
+    assert result.dof == expected[2]
+
+
+@pytest.mark.parametrize('engine', ['scipy', 'fast'])
+@pytest.mark.parametrize('test, scipy_test', [('kruskal', kruskal), ('anova', f_oneway)])
+def test_numeric_across_groups_with_missing_values(use_numba, engine, test, scipy_test):
+    rng = np.random.default_rng(1)
+    values, codes = make_groups(rng, 4)
+    values[rng.random(len(values)) < 0.2] = np.nan
+    # Group 'c' has no observations left, and some rows have no group
+    labels = np.array(['a', 'b', 'c', 'd'], dtype=object)[codes]
+    values[labels == 'c'] = np.nan
+    labels[rng.random(len(labels)) < 0.1] = None
+
+    result = stat_tests.test_numeric_across_groups_arr(values, labels, test=test, engine=engine)
+
+    groups = []
+    for label in ['a', 'b', 'd']:
+        group = values[labels == label]
+        groups.append(group[~np.isnan(group)])
+    expected = scipy_test(*groups)
+    assert result.statistic == pytest.approx(expected.statistic, rel=RTOL)
+    assert result.p_value == pytest.approx(expected.pvalue, rel=RTOL)
+    assert result.dof == 2
+
+
+@pytest.mark.parametrize('engine', ['scipy', 'fast'])
+def test_compare_distributions_across_datasets(use_numba, engine):
+    rng = np.random.default_rng(2)
+    dataframes = []
+    for n_rows in [50, 70, 30]:
+        dataframes.append(pd.DataFrame({
+            'value': rng.integers(0, 10, n_rows).astype(np.float32),
+            'level': pd.Categorical(rng.choice([1, 2, 3], n_rows)),
+        }))
+    dataframes[1].loc[:5, 'value'] = np.nan
+
+    result = stat_tests.compare_distributions_across_datasets(dataframes, ['a', 'b', 'c'], 'value', engine=engine)
+    groups = []
+    for df in dataframes:
+        groups.append(df['value'].dropna().to_numpy(dtype=np.float64))
+    expected = kruskal(*groups)
+    assert result.statistic == pytest.approx(expected.statistic, rel=RTOL)
+    assert result.p_value == pytest.approx(expected.pvalue, rel=RTOL)
+
+    result = stat_tests.compare_distributions_across_datasets(dataframes, ['a', 'b', 'c'], 'level')
+    expected = chi2_contingency(pd.crosstab(np.repeat([0, 1, 2], [50, 70, 30]),
+                                            pd.concat([df['level'] for df in dataframes]).to_numpy()).to_numpy())
+    assert result.statistic == pytest.approx(expected[0], rel=RTOL)
+    assert result.p_value == pytest.approx(expected[1], rel=RTOL)
+
+
+def test_sort_order_not_cached_for_views_of_modified_frames():
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({'value': rng.normal(size=200), 'group': np.repeat([0, 1, 2, 3], 50)})
+    values = df['value'].to_numpy()
+    groups = df['group'].to_numpy()
+    stat_tests.test_numeric_across_groups_arr(values, groups, engine='fast')
+
+    # An in-place update of the frame can change the buffer behind the read-only view
+    df.loc[df['group'] == 0, 'value'] += 10
+    result = stat_tests.test_numeric_across_groups_arr(values, groups, engine='fast')
+    expected = stat_tests.test_numeric_across_groups_arr(values.copy(), groups, engine='fast')
+    assert result.statistic == pytest.approx(expected.statistic, rel=RTOL)
+
+
+def test_prepared_arrays_reuse_the_sort_order():
+    values = np.array([3.0, 1.0, 2.0])
+    values.flags.writeable = False
+    assert stat_tests._sort_order(values) is stat_tests._sort_order(values)
+
+
+@pytest.mark.parametrize('modify', ['replace', 'in_place'])
+def test_prepared_arrays_not_reused_for_modified_frames(modify):
+    rng = np.random.default_rng(4)
+    dataframes = []
+    for _ in range(3):
+        dataframes.append(pd.DataFrame({'value': rng.normal(size=60)}))
+    names = ['a', 'b', 'c']
+    stat_tests.compare_distributions_across_datasets(dataframes, names, 'value')
+    # Unchanged dataframes reuse the prepared arrays
+    values, _ = stat_tests._prepare_feature_arrays(dataframes, 'value', 'numeric')
+    assert stat_tests._prepare_feature_arrays(dataframes, 'value', 'numeric')[0] is values
+
+    if modify == 'replace':
+        dataframes[0]['value'] = dataframes[0]['value'] + 5
+    else:
+        dataframes[0].loc[:, 'value'] += 5
+    result = stat_tests.compare_distributions_across_datasets(dataframes, names, 'value')
+
+    stat_tests.clear_prepared_cache()
+    expected = stat_tests.compare_distributions_across_datasets(dataframes, names, 'value')
+    assert result.statistic == pytest.approx(expected.statistic, rel=RTOL)
+
+
+def test_compare_categoricals_with_different_category_dtypes():
+    rng = np.random.default_rng(5)
+    sex = [rng.choice([0, 1], 80), rng.choice([0.0, 1.0, np.nan], 60)]
+    dataframes = [
+        pd.DataFrame({'Sex': pd.Categorical(sex[0], categories=pd.Index([0, 1], dtype='int8'))}),
+        pd.DataFrame({'Sex': pd.Series(sex[1]).astype('category')}),
+    ]
+    result = stat_tests.compare_distributions_across_datasets(dataframes, ['a', 'b'], 'Sex')
+    observed = ~np.isnan(sex[1])
+    expected = chi2_contingency(pd.crosstab(np.repeat([0, 1], [80, observed.sum()]),
+                                            np.concatenate([sex[0], sex[1][observed]])).to_numpy())
+    assert result.statistic == pytest.approx(expected[0], rel=RTOL)
+    assert result.p_value == pytest.approx(expected[1], rel=RTOL)
+
+
+def string_feature_frames():
+    """Three dataframes with a string feature (with missing values) and the expected chi-square test."""
+    rng = np.random.default_rng(6)
+    labels = []
+    for n_rows in [40, 60, 50]:
+        labels.append(list(rng.choice(np.array(['normal', 'fixed', 'reversible', None], dtype=object), n_rows)))
+    dataset = np.repeat([0, 1, 2], [len(values) for values in labels])
+    feature = np.array(sum(labels, []), dtype=object)
+    observed = pd.notna(feature)
+    expected = chi2_contingency(pd.crosstab(dataset[observed], feature[observed]).to_numpy())
+    return labels, expected
+
+
+@pytest.mark.parametrize('dtype', ['str', 'string', object])
+def test_compare_string_feature(dtype):
+    labels, expected = string_feature_frames()
+    dataframes = []
+    for values in labels:
+        dataframes.append(pd.DataFrame({'Thal': pd.Series(values, dtype=dtype)}))
+    result = stat_tests.compare_distributions_across_datasets(dataframes, ['a', 'b', 'c'], 'Thal')
+    assert result.statistic == pytest.approx(expected[0], rel=RTOL)
+    assert result.p_value == pytest.approx(expected[1], rel=RTOL)
+
+
+def test_compare_arrow_dictionary_feature():
+    pa = pytest.importorskip('pyarrow')
+    labels, expected = string_feature_frames()
+    dataframes = []
+    for values in labels:
+        # Two chunks with their own dictionaries, so the dictionaries have to be unified
+        half = len(values) // 2
+        chunks = pa.chunked_array([pa.array(values[:half], pa.string()).dictionary_encode(),
+                                   pa.array(values[half:], pa.string()).dictionary_encode()])
+        dataframes.append(pd.DataFrame({'Thal': pd.Series(pd.arrays.ArrowExtensionArray(chunks))}))
+    assert stat_tests._is_arrow_dictionary(dataframes[0]['Thal'])
+    result = stat_tests.compare_distributions_across_datasets(dataframes, ['a', 'b', 'c'], 'Thal')
+    assert result.statistic == pytest.approx(expected[0], rel=RTOL)
+    assert result.p_value == pytest.approx(expected[1], rel=RTOL)
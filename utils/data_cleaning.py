@@ -1,4 +1,5 @@
 import pandas as pd
+import numpy as np
 
 
 def add_missingness_indicators(dataframe: pd.DataFrame,
@@ -6,6 +7,7 @@ def add_missingness_indicators(dataframe: pd.DataFrame,
                                 suffix: str = '_missing') -> pd.DataFrame:
     """
     Add binary missingness indicator columns.
+    The indicators are computed in one pass as a uint8 block and appended with a single concat.
     
     Parameters:
         dataframe (pd.DataFrame): Input dataframe
@@ -13,16 +15,16 @@ def add_missingness_indicators(dataframe: pd.DataFrame,
         suffix (str): Suffix for indicator column names
         
     Returns:
-        df_copy (pd.DataFrame): Dataframe with added indicator columns
+        df_indicators (pd.DataFrame): Dataframe with added indicator columns
     """
-    df_copy = dataframe.copy()
-    
-    for feature in features:
-        if feature in df_copy.columns:
-            indicator_name = f"{feature}{suffix}"
-            df_copy[indicator_name] = df_copy[feature].isnull().astype(int)
+    cols = [feature for feature in features if feature in dataframe.columns]
+    indicator_names = [f"{feature}{suffix}" for feature in cols]
+
+    mask = dataframe[cols].isna().to_numpy(dtype=np.uint8)
+    indicators = pd.DataFrame(mask, columns=indicator_names, index=dataframe.index)
     
-    return df_copy
+    df_indicators = pd.concat([dataframe, indicators], axis=1)
+    return df_indicators
 
 
 def simple_impute_numeric(dataframe: pd.DataFrame,
@@ -37,17 +39,18 @@ def simple_impute_numeric(dataframe: pd.DataFrame,
         strategy (str): 'mean', 'median', or specific value
         
     Returns:
-        df_copy (pd.DataFrame): Dataframe with imputed values
+        df_imputed (pd.DataFrame): Dataframe with imputed values
     """
-    df_copy = dataframe.copy()
+    values = dataframe[feature]
     
     if strategy == 'mean':
-        fill_value = df_copy[feature].mean()
+        fill_value = values.mean()
     elif strategy == 'median':
-        fill_value = df_copy[feature].median()
+        fill_value = values.median()
     else:
         fill_value = strategy
     
-    df_copy[feature].fillna(fill_value, inplace=True)
+    # assign only replaces the imputed column, the rest of the frame is not copied
+    df_imputed = dataframe.assign(**{feature: values.fillna(fill_value)})
         
-    return df_copy
+    return df_imputed
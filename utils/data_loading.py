@@ -8,9 +8,32 @@ The goal with these functions is to be simple and readable, hence no fancy list
 This module was created for the loading process of the datasets to keep everything consistent between the different notebooks.
 """
 
+import os
+import json
+import warnings
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
 
+# Levels of the low-cardinality coded features (from the UCI Heart Disease documentation).
+# Fixing the categories up-front keeps the columns categorical once the datasets are concatenated.
+CATEGORICAL_LEVELS = {
+    "Sex": [0, 1],
+    "Chest Pain": [1, 2, 3, 4],
+    "FBS": [0, 1],
+    "Rest ECG": [0, 1, 2],
+    "Ex Angina": [0, 1],
+    "Slope": [1, 2, 3],
+    "Thal": [3, 6, 7],
+}
+
+# Version of the preparation pipeline stored with the Parquet cache. Bump it whenever the loading or cleaning
+# steps change what the prepared datasets look like (rows, columns, dtypes), so caches built by older code are rebuilt.
+CACHE_VERSION = 2
+
 def convert_question_mark_to_nan (dataframe: pd.DataFrame) -> pd.DataFrame:
     """
     Instead of using NaN or null values to denote empty entries, the UCI Heart Disease datasets use a question mark (?) character. This can cause issues if not converted; as a result this function handles that. 
@@ -21,8 +44,7 @@ def convert_question_mark_to_nan (dataframe: pd.DataFrame) -> pd.DataFrame:
     Returns:
         dataframe (pd.DataFrame) : Dataframe with "?" characters replaced with NaN values 
     """
-    modified_df = dataframe.replace("?", np.nan)
-    return modified_df
+    return dataframe.replace("?", np.nan)
 
 
 def create_file_path (filename : str, 
@@ -39,26 +61,50 @@ def create_file_path (filename : str,
     Returns:
         file_path (str): Complete file path
     """
-    file_path = f"./{directory}/{file_prefix}.{filename}"
+    file_path = os.path.join(directory, f"{file_prefix}.{filename}")
     return file_path
 
 def load_datasets(filepaths : list[str], 
-                    seperator : str = ",") -> list[pd.DataFrame]:
+                    seperator : str = ",",
+                    na_values : tuple[str, ...] = ("?",),
+                    dtype = None,
+                    header = "infer",
+                    engine : str | None = None) -> list[pd.DataFrame]:
     """
     Load multiple datasets from file paths.
+    The missing value markers are handled by the parser itself, so numeric columns come out as floats right away
+    instead of strings that need to be replaced and converted afterwards.
+    The files are read concurrently in a thread pool (the CSV parsers release the GIL), and the order of the
+    returned dataframes matches the order of the file paths.
     
     Parameters:
         filepaths (list of str): List of file paths to load
         separator (str): Column separator (default: comma)
+        na_values (tuple of str): Extra strings to parse as NaN (default: "?", used by the UCI files)
+        dtype (str, type or dict): Optional dtype hint passed on to the parser
+        header (int, None or "infer"): Row to use as the column names, None if the files have no header row
+        engine (str): CSV parser to use, defaults to the multithreaded "pyarrow" parser when pyarrow is installed
         
     Returns:
         dataframes (list of pd.DataFrame) : Loaded dataframes
     """
+    if engine is None:
+        engine = "pyarrow" if importlib.util.find_spec("pyarrow") is not None else "c"
+
+    def read_file(filepath: str) -> pd.DataFrame:
+        return pd.read_csv(filepath, 
+                            sep=seperator, 
+                            header=header,
+                            na_values=na_values, 
+                            keep_default_na=True, 
+                            dtype=dtype,
+                            engine=engine)
+
+    filepaths = list(filepaths)
+    n_workers = max(1, min(len(filepaths), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        dataframes = list(executor.map(read_file, filepaths))
 
-    dataframes = []
-    for filepath in filepaths:
-        df = pd.read_csv(filepath, sep=seperator) 
-        dataframes.append(df)
     if len(dataframes) == 0:
         print("No dataframe was loaded. Check the file paths.")
     return dataframes
@@ -68,6 +114,8 @@ def add_dataset_identifier (dataframes: list[pd.DataFrame],
                             column_name: str = "Dataset") -> list[pd.DataFrame]:
     """
     Add dataset identifier column to each dataframe.
+    The identifier is stored as a categorical sharing the same categories across all dataframes, so it stays
+    categorical (1 byte per row) once the dataframes are concatenated.
     
     Parameters:
         dataframes (list of pd.DataFrame): List of dataframes
@@ -81,27 +129,25 @@ def add_dataset_identifier (dataframes: list[pd.DataFrame],
     if len(dataframes) != len(dataset_names):
         raise ValueError("Number of dataframes must match number of dataset names")
     
+    # assign returns a new dataframe without deep copying the existing columns
     modified_dfs = []
-    for df, name in zip(dataframes, dataset_names):
-        df_copy = df.copy()
-        df_copy[column_name] = name
-        modified_dfs.append(df_copy)
+    for code, df in enumerate(dataframes):
+        identifier = pd.Categorical.from_codes(np.full(len(df), code), categories=dataset_names)
+        modified_dfs.append(df.assign(**{column_name: identifier}))
     return modified_dfs
 
 
 def modify_column_names(dataframe: pd.DataFrame, 
-                        col_names: list[str], 
-                        inplace: bool = False) -> pd.DataFrame:
+                        col_names: list[str]) -> pd.DataFrame:
     """
     Assign new column names to a dataframe.
     
     Parameters:
         dataframe (pd.DataFrame): DataFrame to modify
         col_names (list of str): New column names
-        inplace (bool): If True, modify original dataframe
         
     Returns:
-        df_copy (pd.DataFrame): DataFrame with new column names
+        renamed (pd.DataFrame): DataFrame with new column names
     """
     if dataframe.shape[1] != len(col_names):
         raise ValueError(
@@ -109,19 +155,16 @@ def modify_column_names(dataframe: pd.DataFrame,
             f"but {len(col_names)} names provided."
         )
     
-    if inplace:
-        dataframe.columns = col_names
-        return dataframe
-    else:
-        df_copy = dataframe.copy()
-        df_copy.columns = col_names
-        return df_copy
+    # set_axis returns a new frame, so there is no need for an explicit copy beforehand
+    renamed = dataframe.set_axis(col_names, axis=1)
+    return renamed
 
 
 def combine_datasets(dataframes: list[pd.DataFrame], 
                         reset_index: bool = True) -> pd.DataFrame:
     """
     Concatenate multiple dataframes into one.
+    The input blocks are not copied up-front, so the input dataframes should not be mutated afterwards.
     
     Parameters:
         dataframes (list of pd.DataFrame): Dataframes to combine
@@ -130,11 +173,27 @@ def combine_datasets(dataframes: list[pd.DataFrame],
     Returns:
         combined (pd.DataFrame): Combined dataframe
     """
-    combined = pd.concat(dataframes, 
-                            ignore_index=reset_index)
+    if int(pd.__version__.split(".")[0]) >= 3:
+        # Copy-on-Write (always on since pandas 3.0) already avoids the copy, and the copy keyword is deprecated
+        combined = pd.concat(dataframes, 
+                                ignore_index=reset_index)
+    else:
+        combined = pd.concat(dataframes, 
+                                ignore_index=reset_index, 
+                                copy=False)
     return combined
 
 def apply_domain_cleaning(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert physiologically implausible values to NaN (e.g. a cholesterol of 0).
+    All of the checked columns are compared against their bounds in a single NumPy pass.
+    
+    Parameters:
+        dataframe (pd.DataFrame): Input dataframe with the named CVD columns
+        
+    Returns:
+        df_cleaned (pd.DataFrame): Dataframe with out of range values set to NaN
+    """
     # Plausible ranges (screening thresholds; adjust if clinical context suggests otherwise)
     range_checks = {
         'Age': (0, 120),
@@ -143,36 +202,285 @@ def apply_domain_cleaning(dataframe: pd.DataFrame) -> pd.DataFrame:
         'Max HR': (60, 220),
         'Oldpeak': (0, 10),
     }
-    df_copy = dataframe.copy()
+    cols = list(range_checks.keys())
+    lower_bounds = np.array([bounds[0] for bounds in range_checks.values()], dtype=np.float32)
+    upper_bounds = np.array([bounds[1] for bounds in range_checks.values()], dtype=np.float32)
 
-    for col, (min_val, max_val) in range_checks.items():
-        out_of_range = ((df_copy[col] < min_val) | (df_copy[col] > max_val) & df_copy[col].notnull())
-    return df_copy 
+    # NaN compares as False on both sides, so missing values are left untouched
+    values = dataframe[cols].to_numpy(dtype=np.float32)
+    out_of_range = (values < lower_bounds) | (values > upper_bounds)
 
+    cleaned = np.where(out_of_range, np.float32(np.nan), values)
 
-def modify_datataset(dataframe: pd.DataFrame, column_names):
+    # assign only replaces the checked columns, the other columns are shared with the input instead of copied
+    cleaned_columns = {}
+    for idx, col in enumerate(cols):
+        cleaned_columns[col] = cleaned[:, idx]
+    return dataframe.assign(**cleaned_columns)
+
+
+def downcast_numeric_columns(dataframe: pd.DataFrame, 
+                                target_column: str = "CVD Class") -> pd.DataFrame:
     """
-    Docstring for modify_datataset
+    Store the numeric columns as float32, and the target as a nullable Int8.
+    The clinical measurements are integer valued or have a single decimal, so float64 only doubles the memory
+    (and the bytes moved by every aggregate) without any gain in precision.
     
     Parameters:
-        dataframe: Description
-        :type dataframe: pd.DataFrame
+        dataframe (pd.DataFrame): Input dataframe
+        target_column (str): Integer valued target column
+        
     Returns:
-        :param column_names: Description
+        df_downcast (pd.DataFrame): Dataframe with downcast numeric columns
     """
-    df_copy = dataframe.copy()
-    df_modified = modify_column_names(df_copy, column_names)
-    df_modified = convert_question_mark_to_nan(df_modified)
+    dtypes = {}
+    for col in dataframe.select_dtypes(include=[np.number]).columns:
+        dtypes[col] = np.float32
+    if target_column in dataframe.columns:
+        dtypes[target_column] = "Int8"
+
+    df_downcast = dataframe.astype(dtypes)
+    return df_downcast
+
+
+def convert_categorical_columns(dataframe: pd.DataFrame, 
+                                categorical_levels: dict[str, list[int]] = CATEGORICAL_LEVELS) -> pd.DataFrame:
+    """
+    Convert the coded categorical features to the category dtype (int8 categories), which stores one byte per row
+    and makes groupby/value_counts on these columns work on integer codes.
+    Values outside the given levels cannot be stored in the categorical and become NaN; they are counted and
+    reported in a warning first, so invalid codes are not dropped silently.
+    
+    Parameters:
+        dataframe (pd.DataFrame): Input dataframe
+        categorical_levels (dict): Column name -> list of valid levels
+        
+    Returns:
+        df_categorical (pd.DataFrame): Dataframe with categorical columns
+    """
+    dtypes = {}
+    masked_columns = {}
+    for col, levels in categorical_levels.items():
+        if col in dataframe.columns:
+            dtypes[col] = pd.CategoricalDtype(pd.Index(levels, dtype="int8"))
+            invalid = dataframe[col].notna() & ~dataframe[col].isin(levels)
+            invalid_count = int(invalid.sum())
+            if invalid_count > 0:
+                warnings.warn(f"{invalid_count} value(s) of '{col}' outside the levels {levels} were set to NaN")
+                masked_columns[col] = dataframe[col].mask(invalid)
+
+    df_categorical = dataframe.assign(**masked_columns).astype(dtypes)
+    return df_categorical
+
+
+def modify_datataset(dataframe: pd.DataFrame, 
+                        column_names: list[str]) -> pd.DataFrame:
+    """
+    Assign column names, apply the domain cleaning, downcast the numeric columns and convert the coded features 
+    to categoricals for a raw dataset ("?" values are already parsed as NaN by load_datasets).
+    Each step returns a new dataframe, so the input is never copied up-front.
+    
+    Parameters:
+        dataframe (pd.DataFrame): Raw dataframe as loaded from file
+        column_names (list of str): Column names to assign
+        
+    Returns:
+        df_modified (pd.DataFrame): Prepared dataframe
+    """
+    df_modified = modify_column_names(dataframe, column_names)
     df_modified = apply_domain_cleaning(df_modified)
+    df_modified = downcast_numeric_columns(df_modified)
+    df_modified = convert_categorical_columns(df_modified)
     return df_modified
 
+def get_cache_paths(dataset_names: list[str], 
+                    directory: str = "data") -> tuple[list[str], str, str]:
+    """
+    Build the Parquet cache file paths for the prepared datasets.
+    
+    Parameters:
+        dataset_names (list of str): Names for each dataset
+        directory (str): Data directory (the cache lives in a "_cache" folder inside it)
+        
+    Returns:
+        cache_paths (tuple): list of per-dataset cache paths, combined dataset cache path, cache key path
+    """
+    cache_directory = os.path.join(directory, "_cache")
+    dataset_paths = []
+    for name in dataset_names:
+        dataset_paths.append(os.path.join(cache_directory, f"{name}.parquet"))
+    combined_path = os.path.join(cache_directory, "combined.parquet")
+    key_path = os.path.join(cache_directory, "cache_key.json")
+    return dataset_paths, combined_path, key_path
+
+
+def build_cache_key(filepaths: list[str], 
+                    dataset_names: list[str],
+                    column_names: list[str]) -> dict:
+    """
+    Describe what a cache was built from: the pipeline version and the parameters of the preparation call.
+    
+    Parameters:
+        filepaths (list of str): Raw file paths
+        dataset_names (list of str): Names for each dataset
+        column_names (list of str): Column names assigned to the raw files
+        
+    Returns:
+        cache_key (dict): JSON serializable cache key
+    """
+    return {
+        "version": CACHE_VERSION,
+        "filepaths": list(filepaths),
+        "dataset_names": list(dataset_names),
+        "column_names": list(column_names),
+    }
+
+
+def is_cache_fresh(cache_paths: list[str], 
+                    source_paths: list[str],
+                    key_path: str,
+                    cache_key: dict) -> bool:
+    """
+    Check that the cache was built from the same pipeline version and parameters, 
+    and that every cache file exists and is newer than all of the source files.
+    
+    Parameters:
+        cache_paths (list of str): Cache file paths
+        source_paths (list of str): Source file paths the cache was built from
+        key_path (str): Path of the stored cache key
+        cache_key (dict): Cache key of the current call (see build_cache_key)
+        
+    Returns:
+        fresh (bool): True if the cache can be used
+    """
+    if not os.path.exists(key_path):
+        return False
+    with open(key_path) as file:
+        try:
+            stored_key = json.load(file)
+        except json.JSONDecodeError:
+            return False
+    if stored_key != cache_key:
+        return False
+
+    for cache_path in cache_paths:
+        if not os.path.exists(cache_path):
+            return False
+
+    newest_source = max(os.path.getmtime(path) for path in source_paths)
+    oldest_cache = min(os.path.getmtime(path) for path in cache_paths)
+    return oldest_cache > newest_source
+
+
+def read_cached_dataset(cache_path: str) -> pd.DataFrame:
+    """
+    Read a prepared dataset back from the Parquet cache.
+    Parquet stores categoricals with integer categories as plain integers, so the categorical dtypes are restored here.
+    
+    Parameters:
+        cache_path (str): Cache file path
+        
+    Returns:
+        dataframe (pd.DataFrame): Prepared dataframe
+    """
+    dataframe = pd.read_parquet(cache_path, engine="pyarrow")
+    return convert_categorical_columns(dataframe)
+
+
+def write_cache(dfs: list[pd.DataFrame], 
+                df_combined: pd.DataFrame,
+                dataset_cache_paths: list[str],
+                combined_cache_path: str,
+                key_path: str,
+                cache_key: dict) -> bool:
+    """
+    Write the prepared datasets to the Parquet cache.
+    The cache is only an optimisation, so a failed write (e.g. a read-only data directory) only warns, 
+    and the key of the partial cache is removed so it is never read.
+    
+    Parameters:
+        dfs (list of pd.DataFrame): Prepared individual dataframes
+        df_combined (pd.DataFrame): Prepared combined dataframe
+        dataset_cache_paths (list of str): Per-dataset cache paths
+        combined_cache_path (str): Combined dataset cache path
+        key_path (str): Path of the cache key
+        cache_key (dict): Cache key of the prepared datasets (see build_cache_key)
+        
+    Returns:
+        written (bool): True if the cache was written
+    """
+    try:
+        os.makedirs(os.path.dirname(combined_cache_path), exist_ok=True)
+        if os.path.exists(key_path):
+            os.remove(key_path)
+        for df, path in zip(dfs, dataset_cache_paths):
+            df.to_parquet(path, engine="pyarrow", compression="zstd")
+        df_combined.to_parquet(combined_cache_path, engine="pyarrow", compression="zstd")
+        # The key is removed first and written last, so an interrupted write leaves no valid cache behind
+        with open(key_path, "w") as file:
+            json.dump(cache_key, file)
+    except OSError as error:
+        try:
+            if os.path.exists(key_path):
+                os.remove(key_path)
+        except OSError:
+            pass
+        warnings.warn(f"Could not write the dataset cache ({error}), the datasets were prepared without it")
+        return False
+    return True
+
+
+def _cached_paths_if_fresh(files: list[str], 
+                            dataset_names: list[str],
+                            column_names: list[str],
+                            directory: str,
+                            file_prefix: str,
+                            use_cache: bool,
+                            filepaths: list[str] | None) -> tuple[list[str], tuple | None, bool]:
+    """
+    Resolve the raw file paths and the Parquet cache of a preparation call, and check whether the cache is fresh.
+    
+    Parameters:
+        files (list of str): File names
+        dataset_names (list of str): Names for each dataset
+        column_names (list of str): Column names to assign
+        directory (str): Data directory
+        file_prefix (str): File prefix
+        use_cache (bool): Whether to read/write the Parquet cache
+        filepaths (list of str): Optional precomputed file paths, used instead of building them from files
+        
+    Returns:
+        (filepaths, cache, fresh) (tuple): raw file paths, 
+                                            (dataset cache paths, combined cache path, key path, cache key) 
+                                            or None when the cache is not used (disabled or pyarrow not installed), 
+                                            whether the cache can be read
+    """
+    # Create file paths (unless the caller already has them)
+    if filepaths is None:
+        filepaths = [create_file_path(f, directory, file_prefix) for f in files]
+
+    if not use_cache or importlib.util.find_spec("pyarrow") is None:
+        return filepaths, None, False
+
+    dataset_cache_paths, combined_cache_path, key_path = get_cache_paths(dataset_names, directory)
+    cache_key = build_cache_key(filepaths, dataset_names, column_names)
+    fresh = is_cache_fresh(dataset_cache_paths + [combined_cache_path], filepaths, key_path, cache_key)
+    return filepaths, (dataset_cache_paths, combined_cache_path, key_path, cache_key), fresh
+
+
 def prepare_cvd_datasets(files: list[str], 
                         dataset_names: list[str],
                         column_names: list[str],
                         directory: str = "data",
-                        file_prefix: str = "processed") -> tuple[list[pd.DataFrame], pd.DataFrame]:
+                        file_prefix: str = "processed",
+                        use_cache: bool = True,
+                        filepaths: list[str] | None = None) -> tuple[list[pd.DataFrame], pd.DataFrame]:
     """
     Complete workflow to load and prepare CVD datasets.
+    The prepared datasets are cached as Parquet files in "<directory>/_cache", so later calls (e.g. from another notebook)
+    read them back directly instead of re-parsing and re-cleaning the raw files. The cache is rebuilt whenever one of the
+    raw files is newer than it, or when it was built by another pipeline version (CACHE_VERSION) or with other 
+    file paths, dataset names or column names. It is skipped entirely if pyarrow is not installed.
     
     Parameters:
         files (list of str): File names
@@ -180,20 +488,101 @@ def prepare_cvd_datasets(files: list[str],
         column_names (list of str): Column names to assign
         directory (str): Data directory
         file_prefix (str): File prefix
+        use_cache (bool): Whether to read/write the Parquet cache
+        filepaths (list of str): Optional precomputed file paths, used instead of building them from files
 
     Returns:
         datasets (tuple): list of individual dataframes, combined dataframe
     """
-    # Create file paths
-    filepaths = [create_file_path(f, directory, file_prefix) for f in files]
-    
-    # Load datasets
-    dfs = load_datasets(filepaths)
+    # Use the Parquet cache when it is up to date with the raw files and the pipeline
+    filepaths, cache, fresh = _cached_paths_if_fresh(files, dataset_names, column_names, directory, file_prefix,
+                                                        use_cache, filepaths)
+    if fresh:
+        dataset_cache_paths, combined_cache_path, _, _ = cache
+        dfs = [read_cached_dataset(path) for path in dataset_cache_paths]
+        df_combined = read_cached_dataset(combined_cache_path)
+        return dfs, df_combined
     
-    # Assign column names, Replace "?" values with NaN and convert impossible values to NaN
-    dfs = [modify_datataset(df, column_names) for df in dfs]
+    # Load datasets (the raw files have no header row, "?" is parsed as NaN, 
+    # and every UCI column is numeric so it can be read as float32 directly), then
+    # assign column names, convert impossible values to NaN, downcast the numeric columns and convert coded features to categoricals
+    raw_dfs = load_datasets(filepaths, na_values=("?",), dtype="float32", header=None)
+    dfs = [modify_datataset(df, column_names) for df in raw_dfs]
+    del raw_dfs
     
-    # Combine
+    # Label each row with its dataset and combine
+    dfs = add_dataset_identifier(dfs, dataset_names)
     df_combined = combine_datasets(dfs)
     
+    # Write the cache for the next call
+    if cache is not None:
+        write_cache(dfs, df_combined, *cache)
+    
     return dfs, df_combined
+
+
+@lru_cache(maxsize=4)
+def _prepare_cvd_datasets_memoized(files: tuple[str, ...], 
+                                    dataset_names: tuple[str, ...],
+                                    column_names: tuple[str, ...],
+                                    directory: str) -> tuple[list[pd.DataFrame], pd.DataFrame]:
+    """
+    prepare_cvd_datasets with hashable (tuple) arguments, so the results can be memoized.
+    """
+    return prepare_cvd_datasets(list(files), list(dataset_names), list(column_names), directory)
+
+
+def prepare_cvd_datasets_memoized(files: list[str], 
+                                    dataset_names: list[str],
+                                    column_names: list[str],
+                                    directory: str = "data") -> tuple[list[pd.DataFrame], pd.DataFrame]:
+    """
+    Memoized prepare_cvd_datasets: calls with the same arguments return the same dataframes.
+    The memo lives in this module, so it survives reloading the modules that call this (importlib.reload or 
+    notebook autoreload re-running load_datasets.py); a fresh kernel reads the Parquet cache instead.
+    The returned dataframes are shared between the callers, copy them before modifying them in place.
+    
+    Parameters:
+        files (list of str): File names
+        dataset_names (list of str): Names for each dataset
+        column_names (list of str): Column names to assign
+        directory (str): Data directory
+
+    Returns:
+        datasets (tuple): list of individual dataframes, combined dataframe
+    """
+    return _prepare_cvd_datasets_memoized(tuple(files), tuple(dataset_names), tuple(column_names), directory)
+
+
+def load_combined(files: list[str], 
+                    dataset_names: list[str],
+                    column_names: list[str],
+                    directory: str = "data",
+                    file_prefix: str = "processed",
+                    use_cache: bool = True,
+                    filepaths: list[str] | None = None) -> pd.DataFrame:
+    """
+    Load only the combined CVD dataset. 
+    When the Parquet cache is up to date, only the combined file is read and the individual datasets are never built;
+    otherwise this runs prepare_cvd_datasets and keeps only the combined dataframe.
+    
+    Parameters:
+        files (list of str): File names
+        dataset_names (list of str): Names for each dataset
+        column_names (list of str): Column names to assign
+        directory (str): Data directory
+        file_prefix (str): File prefix
+        use_cache (bool): Whether to read/write the Parquet cache
+        filepaths (list of str): Optional precomputed file paths, used instead of building them from files
+
+    Returns:
+        df_combined (pd.DataFrame): Combined dataframe
+    """
+    filepaths, cache, fresh = _cached_paths_if_fresh(files, dataset_names, column_names, directory, file_prefix,
+                                                        use_cache, filepaths)
+    if fresh:
+        return read_cached_dataset(cache[1])
+
+    _, df_combined = prepare_cvd_datasets(files, dataset_names, column_names, directory, file_prefix,
+                                            use_cache=use_cache, filepaths=filepaths)
+    return df_combined
@@ -18,16 +18,16 @@ def calculate_missingness_summary(dataframe: pd.DataFrame) -> pd.DataFrame:
         missing summary (pd.DataFrame): Summary of missing values.
     """
     
-    missing_counts = dataframe.isnull().sum()
+    # Filter and sort the counts first so only the features with missing values are carried into the summary
+    missing_counts = dataframe.isna().sum()
+    missing_counts = missing_counts[missing_counts > 0].sort_values(ascending=False)
+
+    counts = missing_counts.to_numpy()
     missing_summary = pd.DataFrame({ 
-        'Feature': dataframe.columns, 
-        'Missing_Count': missing_counts.values, 
-        'Missing_Percent': (missing_counts / len(dataframe) * 100).values
+        'Feature': missing_counts.index, 
+        'Missing_Count': counts, 
+        'Missing_Percent': counts / len(dataframe) * 100
     })
-
-    missing_summary = missing_summary[missing_summary['Missing_Count'] > 0]
-    missing_summary = missing_summary.sort_values('Missing_Percent', ascending=False)
-    missing_summary = missing_summary.reset_index(drop=True)
     
     return missing_summary
 
@@ -41,7 +41,7 @@ def get_complete_case_percentage(dataframe: pd.DataFrame) -> float:
     Returns:
         percent records (float) : Percentage of complete cases
     """
-    complete_cases = (~dataframe.isnull().any(axis=1)).sum()
+    complete_cases = (~dataframe.isna().to_numpy().any(axis=1)).sum()
     percentage = (complete_cases / len(dataframe)) * 100
     return percentage
 
@@ -50,6 +50,7 @@ def create_data_quality_report(dataframe: pd.DataFrame,
                                 dataset_name: str = "Dataset") -> dict:
     """
     Generate comprehensive data quality report.
+    The missingness mask and the duplicate flags are computed once and every metric is derived from them.
     
     Parameters:
         dataframe (pd.DataFrame): Input dataframe
@@ -58,17 +59,25 @@ def create_data_quality_report(dataframe: pd.DataFrame,
     Returns:
         report (dict): Data quality metrics
     """
+    n_rows = len(dataframe)
+    missing = dataframe.isna().to_numpy()
+    n_duplicates = dataframe.duplicated().to_numpy().sum()
+
+    col_missing = missing.sum(axis=0)
+    total_missing = col_missing.sum()
+    n_complete = (~missing.any(axis=1)).sum()
+
     report = {
         'Dataset Name': dataset_name,
-        'N Observations': len(dataframe),
+        'N Observations': n_rows,
         'N Features': dataframe.shape[1],
-        'N Duplicates': dataframe.duplicated().sum(),
-        'Percent Duplicates': (dataframe.duplicated().sum() / len(dataframe) * 100),
-        'N Complete Cases': (~dataframe.isnull().any(axis=1)).sum(),
-        'Percent Complete Cases': get_complete_case_percentage(dataframe),
-        'Total Missing Cells': dataframe.isnull().sum().sum(),
-        'Percent Missing Cells': (dataframe.isnull().sum().sum() / dataframe.size * 100),
-        'Features With Missing Cells': (dataframe.isnull().sum() > 0).sum()
+        'N Duplicates': n_duplicates,
+        'Percent Duplicates': (n_duplicates / n_rows * 100),
+        'N Complete Cases': n_complete,
+        'Percent Complete Cases': (n_complete / n_rows * 100),
+        'Total Missing Cells': total_missing,
+        'Percent Missing Cells': (total_missing / dataframe.size * 100),
+        'Features With Missing Cells': (col_missing > 0).sum()
     }
     
     return report
\ No newline at end of file
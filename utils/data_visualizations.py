@@ -23,18 +23,27 @@ def setup_plot_style(style: str = 'seaborn-v0_8-darkgrid',
 
 
 def plot_missingness_heatmap(dataframe: pd.DataFrame,
-                                figsize: tuple[int, int] = (12, 6)) -> None:
+                                figsize: tuple[int, int] = (12, 6),
+                                max_rows: int = 2000) -> None:
     """
     Create heatmap visualization of missing values.
+    The missingness mask is drawn as a single image, and rows are evenly subsampled when there are more than max_rows.
     
     Parameters:
         dataframe (pd.DataFrame): Input dataframe
         figsize (tuple): Figure size
+        max_rows (int): Maximum number of rows to draw
     """
+    mask = dataframe.isna().to_numpy(dtype=np.uint8)
+    if mask.shape[0] > max_rows:
+        step = int(np.ceil(mask.shape[0] / max_rows))
+        mask = mask[::step]
 
     plt.figure(figsize=figsize)
-    sns.heatmap(dataframe.isnull(), cbar=True, yticklabels=False, 
-                cmap='viridis', cbar_kws={'label': 'Missing'})
+    plt.imshow(mask, aspect='auto', cmap='viridis', interpolation='nearest', vmin=0, vmax=1)
+    plt.colorbar(label='Missing')
+    plt.xticks(range(dataframe.shape[1]), dataframe.columns, rotation=90)
+    plt.yticks([])
     plt.title('Missing Values Heatmap', fontweight='bold', fontsize=14)
     plt.xlabel('Features')
     plt.tight_layout()
@@ -61,10 +70,15 @@ def plot_feature_distributions(dataframe: pd.DataFrame,
     n_rows = int(np.ceil(n_features / n_cols))
     
     fig, axes = plt.subplots(n_rows, n_cols, figsize=figsize)
-    axes = axes.flatten() if n_features > 1 else [axes]
+    axes = np.atleast_1d(np.asarray(axes)).ravel()
+    
+    # Convert all of the features to one float32 array up-front and bin each column with NumPy
+    values = dataframe[features].to_numpy(dtype=np.float32, na_value=np.nan)
     
     for idx, feature in enumerate(features):
-        dataframe[feature].hist(bins=30, ax=axes[idx], edgecolor='black', alpha=0.7)
+        column = values[:, idx]
+        counts, edges = np.histogram(column[~np.isnan(column)], bins=30)
+        axes[idx].bar(edges[:-1], counts, width=np.diff(edges), align='edge', edgecolor='black', alpha=0.7)
         axes[idx].set_title(f'{feature}', fontweight='bold')
         axes[idx].set_xlabel(feature)
         axes[idx].set_ylabel('Frequency')
@@ -98,8 +112,13 @@ def plot_boxplots_by_group(dataframe: pd.DataFrame,
 
     plt.figure(figsize=figsize)
     
-    groups = dataframe.groupby(group_var)[numeric_var].apply(list)
-    data_to_plot = [group for group in groups]
+    # Hand each group to matplotlib as a NaN-free ndarray instead of building Python lists
+    labels = []
+    data_to_plot = []
+    for name, values in dataframe.groupby(group_var, observed=True)[numeric_var]:
+        values = values.to_numpy(dtype=float)
+        labels.append(name)
+        data_to_plot.append(values[~np.isnan(values)])
     
     bp = plt.boxplot(data_to_plot, patch_artist=True)
     
@@ -111,7 +130,7 @@ def plot_boxplots_by_group(dataframe: pd.DataFrame,
     plt.title(f'{numeric_var} by {group_var}', fontweight='bold', fontsize=14)
     plt.xlabel(group_var)
     plt.ylabel(numeric_var)
-    plt.xticks(rotation=45, ha='right')
+    plt.xticks(range(1, len(labels) + 1), labels, rotation=45, ha='right')
     plt.grid(axis='y', alpha=0.3)
     
     plt.tight_layout()
@@ -119,6 +138,58 @@ def plot_boxplots_by_group(dataframe: pd.DataFrame,
     plt.close()
 
 
+def compute_correlation_matrix(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute the Pearson correlation matrix of the numeric features with a few matrix products.
+    Like DataFrame.corr, each pair of features only uses the rows where both values are present.
+    Categorical columns with numeric categories (the coded features, e.g. Sex or Chest Pain) are included
+    through their category values, as they were before being stored as categoricals.
+    
+    Parameters:
+        dataframe (pd.DataFrame): Input dataframe
+        
+    Returns:
+        corr_matrix (pd.DataFrame): Correlation matrix of the numeric features
+    """
+    numeric_cols = []
+    for col in dataframe.columns:
+        dtype = dataframe[col].dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            if pd.api.types.is_numeric_dtype(dtype.categories.dtype):
+                numeric_cols.append(col)
+        elif pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+            numeric_cols.append(col)
+    numeric_cols = pd.Index(numeric_cols)
+
+    values = np.empty((len(dataframe), len(numeric_cols)), dtype=np.float64)
+    for idx, col in enumerate(numeric_cols):
+        column = dataframe[col]
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            # Category values instead of the category codes, missing values become NaN
+            column = column.astype(np.float64)
+        values[:, idx] = column.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    # Centering first keeps the moment sums small, which avoids cancellation in the variance terms
+    valid = ~np.isnan(values)
+    centered = np.where(valid, values - np.nanmean(values, axis=0), 0.0)
+    present = valid.astype(np.float64)
+
+    # Pairwise sums over the rows where both features are present
+    n = present.T @ present
+    sum_x = centered.T @ present
+    sum_xx = (centered * centered).T @ present
+    sum_xy = centered.T @ centered
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = n * sum_xy - sum_x * sum_x.T
+        var_x = n * sum_xx - sum_x * sum_x
+        corr = cov / np.sqrt(var_x * var_x.T)
+    corr = np.clip(corr, -1, 1)
+
+    corr_matrix = pd.DataFrame(corr, index=numeric_cols, columns=numeric_cols)
+    return corr_matrix
+
+
 def plot_correlation_matrix(dataframe: pd.DataFrame,
                             figsize: tuple[int, int] = (12, 10),
                             annot: bool = False) -> None:
@@ -130,8 +201,7 @@ def plot_correlation_matrix(dataframe: pd.DataFrame,
         figsize (tuple): Figure size
         annot (bool): Whether to annotate cells with values
     """
-    numeric_cols = dataframe.select_dtypes(include=[np.number]).columns
-    corr_matrix = dataframe[numeric_cols].corr()
+    corr_matrix = compute_correlation_matrix(dataframe)
     
     plt.figure(figsize=figsize)
     sns.heatmap(corr_matrix, annot=annot, fmt='.2f', cmap='coolwarm', 
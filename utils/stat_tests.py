@@ -2,12 +2,164 @@
 Statistical tests 
 """
 
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
 import pandas as pd 
-from scipy.stats import chi2_contingency, kruskal, f_oneway
+from pandas.api.types import union_categoricals
+from scipy.stats import chi2 as chi2_distribution
+from scipy.stats import f as f_distribution
+from scipy.stats import f_oneway, kruskal, norm
+
+# The compiled ranking kernels are optional, without numba the NumPy versions are used
+try:
+    from utils.stat_tests_numba import kruskal_h_statistic, ranks_from_order
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Sort orders of read-only value arrays that own their data (such as the cached compare_distributions_across_datasets arrays), 
+# keyed by array id; weak references confirm the id still belongs to the same array
+_SORT_ORDER_CACHE = OrderedDict()
+_SORT_ORDER_CACHE_SIZE = 128
+_SORT_ORDER_CACHE_LOCK = threading.Lock()
+
+class TestResult(NamedTuple):
+    """
+    Result of a statistical test (a plain tuple, which is much cheaper to build than a dict when testing many features).
+    For the numeric tests, variable_1 is the numeric variable and variable_2 the grouping variable.
+    dof is the degrees of freedom of the statistic (the between-groups degrees of freedom for ANOVA).
+    """
+    test: str
+    variable_1: str
+    variable_2: str
+    statistic: float
+    p_value: float
+    dof: int
+
+    def to_dict(self) -> dict:
+        """
+        Convert to the dictionary layout previously returned by the test functions.
+        
+        Returns:
+            result (dict): Test results
+        """
+        if self.test == 'Chi-square':
+            return {
+                'test': self.test,
+                'variable_1': self.variable_1,
+                'variable_2': self.variable_2,
+                'chi2_statistic': self.statistic,
+                'p_value': self.p_value,
+                'degrees_of_freedom': self.dof,
+            }
+        return {
+            'test': self.test,
+            'numeric_variable': self.variable_1,
+            'group_variable': self.variable_2,
+            'statistic': self.statistic,
+            'p_value': self.p_value,
+        }
+
+
+def _contingency_table(codes1: np.ndarray, 
+                        codes2: np.ndarray,
+                        shape: tuple[int, int]) -> np.ndarray:
+    """
+    Count the co-occurrences of two aligned arrays of non-negative codes.
+    Both codes are packed into a single flat key (code1 * n_levels2 + code2), so the whole table is counted by 
+    one np.bincount pass instead of the much slower scattered np.add.at.
+    
+    Parameters:
+        codes1, codes2 (np.ndarray): Codes of each observation (no missing values)
+        shape (tuple): Number of levels of each variable
+        
+    Returns:
+        contingency (np.ndarray): int64 table of counts with the given shape
+    """
+    n_levels1, n_levels2 = shape
+    flat_key = codes1.astype(np.int64) * n_levels2 + codes2
+    contingency = np.bincount(flat_key, minlength=n_levels1 * n_levels2).reshape(n_levels1, n_levels2)
+    return contingency
+
+
+def _chi_square_result(contingency: np.ndarray, 
+                        var1: str, 
+                        var2: str) -> TestResult:
+    """
+    Run the chi-square test on a contingency table and package the result.
+    Levels that were never observed (all-zero rows or columns) are dropped first, like pd.crosstab does.
+    The statistic is computed from the marginals with a single work buffer, and matches chi2_contingency
+    (including its Yates continuity correction when there is one degree of freedom).
+    
+    Parameters:
+        contingency (np.ndarray): Table of counts (var1 levels x var2 levels)
+        var1, var2 (str): Variable names used in the result
+        
+    Returns:
+        result (TestResult): Test results including chi2, p-value, degrees of freedom
+    """
+    contingency = contingency[contingency.any(axis=1)][:, contingency.any(axis=0)]
+    if contingency.size == 0:
+        raise ValueError("The contingency table is empty")
+
+    row_totals = contingency.sum(axis=1)
+    col_totals = contingency.sum(axis=0)
+    expected = np.outer(row_totals, col_totals) / row_totals.sum()
+    dof = (contingency.shape[0] - 1) * (contingency.shape[1] - 1)
+
+    if dof == 0:
+        chi2, p_value = 0.0, 1.0
+    else:
+        work = np.subtract(contingency, expected)
+        if dof == 1:
+            # Yates correction: move each observed count up to 0.5 towards its expected count
+            np.abs(work, out=work)
+            np.subtract(work, 0.5, out=work)
+            np.maximum(work, 0, out=work)
+        np.square(work, out=work)
+        np.divide(work, expected, out=work)
+        chi2 = work.sum()
+        p_value = chi2_distribution.sf(chi2, dof)
+
+    return TestResult('Chi-square', var1, var2, chi2, p_value, dof)
+
+
+def test_categorical_independence_arr(values1: np.ndarray, 
+                                        values2: np.ndarray, 
+                                        var1: str = 'variable_1', 
+                                        var2: str = 'variable_2') -> TestResult:
+    """
+    Perform chi-square test of independence on two aligned arrays of categorical values.
+    The contingency table is counted directly from the factorized codes of both variables (rows where either 
+    variable is missing are left out, like pd.crosstab does).
+    
+    Parameters:
+        values1, values2 (np.ndarray): Categorical values (or codes) of each observation
+        var1, var2 (str): Variable names used in the result
+        
+    Returns:
+        result (TestResult): Test results including chi2, p-value, degrees of freedom
+    """
+    complete = pd.notna(values1) & pd.notna(values2)
+    if not complete.any():
+        raise ValueError(f"No rows where both '{var1}' and '{var2}' are present")
+
+    codes1, _ = pd.factorize(values1[complete], sort=False)
+    codes2, _ = pd.factorize(values2[complete], sort=False)
+
+    contingency = _contingency_table(codes1, codes2, (codes1.max() + 1, codes2.max() + 1))
+    return _chi_square_result(contingency, var1, var2)
+
 
 def test_categorical_independence(dataframe: pd.DataFrame, 
                                     var1: str, 
-                                    var2: str) -> dict:
+                                    var2: str) -> TestResult:
     """
     Perform chi-square test of independence for categorical variables.
     
@@ -16,99 +168,618 @@ def test_categorical_independence(dataframe: pd.DataFrame,
         var1, var2 (str): Categorical variables to test
         
     Returns:
-        result (dict): Test results including chi2, p-value, conclusion
+        result (TestResult): Test results including chi2, p-value, degrees of freedom
     """
-    contingency = pd.crosstab(dataframe[var1], dataframe[var2])
-    chi2, p_value, dof = chi2_contingency(contingency)
+    return test_categorical_independence_arr(dataframe[var1].to_numpy(), 
+                                                dataframe[var2].to_numpy(), 
+                                                var1, var2)
 
+
+def _sort_order(values: np.ndarray) -> np.ndarray:
+    """
+    Stable argsort of values (NaN sorted last). 
+    Only read-only arrays that own their data (such as the arrays prepared by compare_distributions_across_datasets)
+    have their sort order cached for the following rank based tests. A read-only view, e.g. Series.to_numpy() under 
+    Copy-on-Write, can still change when its base is modified in place, so views are always sorted again.
     
-    result = {
-        'test': 'Chi-square',
-        'variable_1': var1,
-        'variable_2': var2,
-        'chi2_statistic': chi2,
-        'p_value': p_value,
-        'degrees_of_freedom': dof,
-    }
+    Parameters:
+        values (np.ndarray): Values to sort
+        
+    Returns:
+        sort_order (np.ndarray): Permutation that sorts values
+    """
+    if values.flags.writeable or values.base is not None:
+        return np.argsort(values, kind='stable')
+
+    key = id(values)
+    with _SORT_ORDER_CACHE_LOCK:
+        cached = _SORT_ORDER_CACHE.get(key)
+        if cached is not None and cached[0]() is values:
+            _SORT_ORDER_CACHE.move_to_end(key)
+            return cached[1]
+
+    sort_order = np.argsort(values, kind='stable')
+    with _SORT_ORDER_CACHE_LOCK:
+        _SORT_ORDER_CACHE[key] = (weakref.ref(values), sort_order)
+        if len(_SORT_ORDER_CACHE) > _SORT_ORDER_CACHE_SIZE:
+            _SORT_ORDER_CACHE.popitem(last=False)
+    return sort_order
+
+
+def _ranks_from_order(sort_order: np.ndarray, 
+                        values: np.ndarray) -> tuple[np.ndarray, float]:
+    """
+    Average ranks (ties get the mean rank of their run) computed in O(N) from a precomputed sort order.
+    The tie term sum(t^3 - t) of the rank test tie corrections comes from the lengths t of the same runs.
     
-    return result
+    Parameters:
+        sort_order (np.ndarray): Permutation that sorts values
+        values (np.ndarray): Values to rank (no missing values)
+        
+    Returns:
+        (ranks, tie_sum) (tuple): Rank of each value, in the original order, and the tie term
+    """
+    if HAS_NUMBA:
+        return ranks_from_order(sort_order, values)
+
+    n_total = len(values)
+    sorted_values = values[sort_order]
+    run_starts = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+    run_ends = np.r_[run_starts[1:], n_total]
+    run_lengths = run_ends - run_starts
+    ranks = np.empty(n_total, dtype=np.float64)
+    ranks[sort_order] = np.repeat((run_starts + 1 + run_ends) / 2.0, run_lengths)
+    run_lengths = run_lengths.astype(np.float64)
+    return ranks, np.sum(run_lengths ** 3 - run_lengths)
+
+
+def _mann_whitney_two_groups(values: np.ndarray, 
+                                codes: np.ndarray,
+                                sort_order: np.ndarray) -> tuple[float, float]:
+    """
+    Two-group specialization of the Kruskal-Wallis test through the Mann-Whitney U statistic.
+    With two groups, the tie corrected H statistic is exactly z^2, where z is the normal approximation of U
+    (tie corrected, no continuity correction), and the chi-square p-value equals the two-sided normal p-value.
+    Only the rank sum of the first group is needed.
+    
+    Parameters:
+        values (np.ndarray): Observations without missing values
+        codes (np.ndarray): Group code (0 or 1) of each observation
+        sort_order (np.ndarray): Permutation that sorts values
+        
+    Returns:
+        (statistic, p_value) (tuple): Kruskal-Wallis H statistic (z^2) and its p-value
+    """
+    n_total = len(values)
+    in_first = codes == 0
+    n_first = np.count_nonzero(in_first)
+    n_second = n_total - n_first
+
+    ranks, tie_sum = _ranks_from_order(sort_order, values)
+    u_statistic = ranks[in_first].sum() - n_first * (n_first + 1) / 2.0
+    u_mean = n_first * n_second / 2.0
+    u_variance = n_first * n_second / 12.0 * ((n_total + 1) - tie_sum / (n_total * (n_total - 1.0)))
+    if u_variance == 0:
+        raise ValueError("All numbers are identical in kruskal")
+
+    z_score = (u_statistic - u_mean) / np.sqrt(u_variance)
+    p_value = 2 * norm.sf(abs(z_score))
+    return z_score ** 2, p_value
+
+
+def _kruskal_wallis(values: np.ndarray, 
+                    codes: np.ndarray,
+                    sort_order: np.ndarray | None = None) -> tuple[float, float]:
+    """
+    Kruskal-Wallis H test computed from one ranking of all the values and per-group rank sums.
+    
+    Parameters:
+        values (np.ndarray): Observations without missing values
+        codes (np.ndarray): Group code (0..k-1) of each observation
+        sort_order (np.ndarray): Optional precomputed permutation that sorts values
+        
+    Returns:
+        (statistic, p_value) (tuple): Tie corrected H statistic and its p-value
+    """
+    n_groups = codes.max() + 1 if len(codes) > 0 else 0
+    if n_groups < 2:
+        raise ValueError("Need at least two groups with observations")
+
+    n_total = len(values)
+    if sort_order is None:
+        sort_order = np.argsort(values, kind='stable')
+    if n_groups == 2:
+        return _mann_whitney_two_groups(values, codes, sort_order)
+
+    if HAS_NUMBA:
+        # Ranking and the per-group rank sums are fused in one compiled pass over the sorted values
+        h_statistic, tie_sum = kruskal_h_statistic(values[sort_order], sort_order, codes)
+    else:
+        ranks, tie_sum = _ranks_from_order(sort_order, values)
+        rank_sums = np.bincount(codes, weights=ranks, minlength=n_groups)
+        group_sizes = np.bincount(codes, minlength=n_groups)
+        h_statistic = 12.0 / (n_total * (n_total + 1)) * np.sum(rank_sums ** 2 / group_sizes) - 3 * (n_total + 1)
+
+    # Tie correction: 1 - sum(t^3 - t) / (N^3 - N) over the lengths t of the tie runs found while ranking
+    tie_correction = 1 - tie_sum / (float(n_total) ** 3 - n_total)
+    if tie_correction == 0:
+        raise ValueError("All numbers are identical in kruskal")
+    h_statistic = h_statistic / tie_correction
+
+    p_value = chi2_distribution.sf(h_statistic, n_groups - 1)
+    return h_statistic, p_value
+
+
+def _one_way_anova(values: np.ndarray, 
+                    codes: np.ndarray) -> tuple[float, float]:
+    """
+    One-way ANOVA F test computed from per-group sums and sums of squares.
+    
+    Parameters:
+        values (np.ndarray): Observations without missing values
+        codes (np.ndarray): Group code (0..k-1) of each observation
+        
+    Returns:
+        (statistic, p_value) (tuple): F statistic and its p-value
+    """
+    n_groups = codes.max() + 1 if len(codes) > 0 else 0
+    if n_groups < 2:
+        raise ValueError("Need at least two groups with observations")
+
+    n_total = len(values)
+    # Centering does not change the sums of squares but avoids cancellation in SSW
+    centered = values - values.mean()
+    group_sizes = np.bincount(codes, minlength=n_groups)
+    group_sums = np.bincount(codes, weights=centered, minlength=n_groups)
+    group_squares = np.bincount(codes, weights=centered * centered, minlength=n_groups)
+    group_means = group_sums / group_sizes
+
+    ss_between = np.sum(group_sizes * group_means ** 2)
+    ss_within = np.sum(group_squares - group_sizes * group_means ** 2)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        f_statistic = (ss_between / (n_groups - 1)) / (ss_within / (n_total - n_groups))
+    p_value = f_distribution.sf(f_statistic, n_groups - 1, n_total - n_groups)
+    return f_statistic, p_value
+
+
+def _compact_codes(codes: np.ndarray) -> np.ndarray:
+    """
+    Renumber group codes so only the groups that still have observations remain, numbered 0..k-1.
+    
+    Parameters:
+        codes (np.ndarray): Non-negative group codes
+        
+    Returns:
+        codes (np.ndarray): Renumbered group codes
+    """
+    if len(codes) == 0:
+        return codes
+    present = np.bincount(codes) > 0
+    if present.all():
+        return codes
+    new_codes = np.cumsum(present) - 1
+    return new_codes[codes]
+
+
+def _split_groups(values: np.ndarray, 
+                    codes: np.ndarray) -> list[np.ndarray]:
+    """
+    Split values into one array per group code.
+    
+    Parameters:
+        values (np.ndarray): Observations without missing values
+        codes (np.ndarray): Group code (0..k-1) of each observation
+        
+    Returns:
+        groups (list of np.ndarray): Values of each group, in code order
+    """
+    order = np.argsort(codes, kind='stable')
+    boundaries = np.cumsum(np.bincount(codes))[:-1]
+    return np.split(values[order], boundaries)
+
+
+def _numeric_test_from_codes(values: np.ndarray, 
+                                codes: np.ndarray, 
+                                test: str,
+                                engine: str = 'scipy') -> tuple[str, float, float, int]:
+    """
+    Run the numeric test on float64 values and already factorized group codes (-1 for a missing group).
+    
+    Parameters:
+        values (np.ndarray): float64 values of each observation (NaN for missing)
+        codes (np.ndarray): Group code of each observation
+        test (str): 'kruskal' for Kruskal-Wallis or 'anova' for one-way ANOVA
+        engine (str): 'scipy' (per-group arrays through scipy.stats) or 'fast' (rank/bincount kernels)
+        
+    Returns:
+        (test_name, statistic, p_value, dof) (tuple): Test results
+    """
+    if engine not in ('scipy', 'fast'):
+        raise ValueError("engine must be 'scipy' or 'fast'")
+    if test not in ('kruskal', 'anova'):
+        raise ValueError("test must be 'kruskal' or 'anova'")
+
+    complete = ~np.isnan(values) & (codes >= 0)
+    group_codes = _compact_codes(codes[complete])
+    
+    if engine == 'scipy':
+        groups = _split_groups(values[complete], group_codes)
+        if test == 'kruskal':
+            stat, p_value = kruskal(*groups)
+            test_name = 'Kruskal-Wallis H'
+        else:
+            stat, p_value = f_oneway(*groups)
+            test_name = 'One-way ANOVA F'
+    elif test == 'kruskal':
+        # Sort the full array (sort order cached when possible) and keep only the complete observations,
+        # renumbered to their positions after masking
+        full_order = _sort_order(values)
+        sort_order = (np.cumsum(complete) - 1)[full_order[complete[full_order]]]
+        stat, p_value = _kruskal_wallis(values[complete], group_codes, sort_order)
+        test_name = 'Kruskal-Wallis H'
+    elif test == 'anova':
+        stat, p_value = _one_way_anova(values[complete], group_codes)
+        test_name = 'One-way ANOVA F'
+    
+    return test_name, stat, p_value, int(group_codes.max())
+
+
+def test_numeric_across_groups_arr(values: np.ndarray, 
+                                    group_labels: np.ndarray,
+                                    numeric_var: str = 'numeric_variable',
+                                    group_var: str = 'group_variable',
+                                    test: str = 'kruskal',
+                                    engine: str = 'scipy') -> TestResult:
+    """
+    Test if a numeric array differs across the groups given by an aligned array of group labels (or codes).
+    Missing values (in either array) are dropped once up-front, and groups left without observations are not tested.
+    
+    engine='scipy' runs scipy.stats.kruskal / f_oneway on per-group arrays, with scipy's input validation.
+    engine='fast' skips that validation and runs the rank (numba when available) and bincount kernels on the 
+    codes directly; it gives the same results on clean input, which internal callers already guarantee.
+    
+    Parameters:
+        values (np.ndarray): Numeric values of each observation (NaN for missing)
+        group_labels (np.ndarray): Group label or code of each observation
+        numeric_var, group_var (str): Variable names used in the result
+        test (str): 'kruskal' for Kruskal-Wallis or 'anova' for one-way ANOVA
+        engine (str): 'scipy' or 'fast'
+        
+    Returns:
+        result (TestResult): Test results
+    """
+    values = np.asarray(values)
+    if values.dtype.kind != 'f':
+        # Object arrays (e.g. from nullable columns) can hold pd.NA, so find the missing values with pd.isna
+        # in one pass and convert only the rest
+        missing = pd.isna(values)
+        converted = np.full(values.shape, np.nan)
+        converted[~missing] = values[~missing].astype(np.float64)
+        values = converted
+    codes, _ = pd.factorize(group_labels, sort=False)
+    test_name, stat, p_value, dof = _numeric_test_from_codes(values.astype(np.float64, copy=False), codes, 
+                                                                test, engine)
+    return TestResult(test_name, numeric_var, group_var, stat, p_value, dof)
 
 
 def test_numeric_across_groups(dataframe: pd.DataFrame, 
                                 numeric_var: str, 
                                 group_var: str,
-                                test: str = 'kruskal') -> dict:
+                                test: str = 'kruskal',
+                                engine: str = 'scipy') -> TestResult:
     """
     Test if numeric variable differs across groups.
+    Missing values (in either variable) are dropped once up-front, and groups left without observations are not tested.
     
     Parameters:
         dataframe : pd.DataFrame Input dataframe
         numeric_var : str Numeric variable to test
         group_var (str): Grouping variable
         test (str): 'kruskal' for Kruskal-Wallis or 'anova' for one-way ANOVA
+        engine (str): 'scipy' (validated scipy.stats functions) or 'fast' (unvalidated kernels), 
+                        see test_numeric_across_groups_arr
         
     Returns:
-        result (dict): Test results
+        result (TestResult): Test results
     """
-    groups = [group[numeric_var].dropna() 
-                for name, group in dataframe.groupby(group_var)]
+    return test_numeric_across_groups_arr(dataframe[numeric_var].to_numpy(dtype=np.float64, na_value=np.nan),
+                                            dataframe[group_var].to_numpy(),
+                                            numeric_var, group_var, test, engine)
+
+
+# Significance levels flagged by the batch tests
+SIGNIFICANCE_LEVELS = np.array([0.001, 0.05, 0.10])
+
+
+def significance_flags(p_values: np.ndarray) -> np.ndarray:
+    """
+    Flag which p-values fall below each of the significance levels.
     
-    if test == 'kruskal':
-        stat, p_value = kruskal(*groups)
-        test_name = 'Kruskal-Wallis H'
-    elif test == 'anova':
-        stat, p_value = f_oneway(*groups)
-        test_name = 'One-way ANOVA F'
-    else:
-        raise ValueError("test must be 'kruskal' or 'anova'")
+    Parameters:
+        p_values (np.ndarray): p-values of N tests
+        
+    Returns:
+        flags (np.ndarray): (N, 3) boolean array, one column per level in SIGNIFICANCE_LEVELS
+    """
+    return np.asarray(p_values, dtype=np.float64)[:, None] < SIGNIFICANCE_LEVELS
+
+
+def batch_test_numeric_across_groups(dataframe: pd.DataFrame,
+                                        numeric_vars: list[str],
+                                        group_var: str,
+                                        test: str = 'kruskal',
+                                        engine: str = 'scipy') -> pd.DataFrame:
+    """
+    Test several numeric variables across the same groups.
+    The grouping variable is factorized once and its codes are reused for every numeric variable.
+    
+    Parameters:
+        dataframe (pd.DataFrame): Input dataframe
+        numeric_vars (list of str): Numeric variables to test
+        group_var (str): Grouping variable
+        test (str): 'kruskal' for Kruskal-Wallis or 'anova' for one-way ANOVA
+        engine (str): 'scipy' or 'fast', see test_numeric_across_groups_arr
+        
+    Returns:
+        results (pd.DataFrame): One row of test results per numeric variable, 
+                                with a boolean column per significance level
+    """
+    codes, _ = pd.factorize(dataframe[group_var].to_numpy(), sort=False)
     
-    result = {
-        'test': test_name,
-        'numeric_variable': numeric_var,
-        'group_variable': group_var,
-        'statistic': stat,
-        'p_value': p_value,
-    }
+    results = []
+    for numeric_var in numeric_vars:
+        values = dataframe[numeric_var].to_numpy(dtype=np.float64, na_value=np.nan)
+        test_name, stat, p_value, dof = _numeric_test_from_codes(values, codes, test, engine)
+        results.append(TestResult(test_name, numeric_var, group_var, stat, p_value, dof))
     
-    return result
+    results = pd.DataFrame(results, columns=TestResult._fields)
+    flags = significance_flags(results['p_value'].to_numpy())
+    for idx, level in enumerate(SIGNIFICANCE_LEVELS):
+        results[f'significant_{level:g}'] = flags[:, idx]
+    return results
+
+
+# Prepared (values, dataset codes) arrays of compare_distributions_across_datasets, most recently used last.
+# Keyed by the ids of the dataframes and the feature; weak references confirm the ids still belong to the same objects,
+# and the feature columns the arrays were built from are kept to confirm the dataframes still hold the same data.
+_PREPARED_CACHE = OrderedDict()
+_PREPARED_CACHE_SIZE = 128
+_PREPARED_CACHE_LOCK = threading.Lock()
+
+
+def clear_prepared_cache() -> None:
+    """
+    Clear the cached feature arrays of compare_distributions_across_datasets (e.g. to free their memory).
+    Modified dataframes are detected on lookup, so this is not needed for correctness.
+    """
+    with _PREPARED_CACHE_LOCK:
+        _PREPARED_CACHE.clear()
+
+
+def _column_data_id(column: pd.Series) -> int:
+    """
+    Identify the data behind a column: the buffer address of NumPy-backed columns, the array object otherwise.
+    While a reference to the column is kept, Copy-on-Write gives the dataframe new data on any modification
+    (replacing the column or setting values in place), so an unchanged id means unchanged data.
+    
+    Parameters:
+        column (pd.Series): Column of a dataframe
+        
+    Returns:
+        data_id (int): Identifier of the column data
+    """
+    if isinstance(column.dtype, np.dtype):
+        return column.to_numpy().__array_interface__['data'][0]
+    return id(column.array)
+
+
+def _is_arrow_dictionary(column: pd.Series) -> bool:
+    """
+    Check whether a column is Arrow-backed and dictionary encoded (e.g. read with dtype_backend='pyarrow').
+    
+    Parameters:
+        column (pd.Series): Column to check
+        
+    Returns:
+        is_dictionary (bool): True for an Arrow dictionary column
+    """
+    # Arrow-backed string columns (the default str dtype) are ArrowExtensionArrays too, 
+    # but with a StringDtype instead of an ArrowDtype, so the dtype is checked rather than the array type
+    if not isinstance(column.dtype, pd.ArrowDtype):
+        return False
+    # pyarrow is necessarily installed once an Arrow-backed column exists
+    import pyarrow as pa
+    return pa.types.is_dictionary(column.dtype.pyarrow_dtype)
+
+
+def _arrow_dictionary_codes(columns: list[pd.Series]) -> np.ndarray:
+    """
+    Concatenated dictionary indices of Arrow dictionary columns, recoded against one merged dictionary.
+    Chunks without missing values are viewed as NumPy arrays without copying, only the final concatenation copies.
+    
+    Parameters:
+        columns (list of pd.Series): Arrow dictionary columns with the same Arrow type
+        
+    Returns:
+        codes (np.ndarray): Dictionary index of each value (-1 for missing)
+    """
+    import pyarrow as pa
+    chunks = []
+    for column in columns:
+        chunks.extend(column.array.__arrow_array__().chunks)
+    unified = pa.chunked_array(chunks, type=columns[0].dtype.pyarrow_dtype).unify_dictionaries()
+
+    code_arrays = []
+    for chunk in unified.chunks:
+        indices = chunk.indices
+        if indices.null_count > 0:
+            indices = indices.fill_null(-1)
+        code_arrays.append(indices.to_numpy(zero_copy_only=True))
+    if not code_arrays:
+        return np.empty(0, dtype=np.int32)
+    return np.concatenate(code_arrays)
+
+
+def _prepare_feature_arrays(dataframes: list[pd.DataFrame], 
+                            feature: str,
+                            kind: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Concatenate a feature across dataframes, with the dataset code of each value in a parallel array.
+    The arrays are cached (read-only) so repeated comparisons of the same feature skip this step, 
+    as long as the dataframes still hold the same feature data.
+    
+    Parameters:
+        dataframes (list of pd.DataFrame): List of dataframes
+        feature (str): Feature to concatenate
+        kind (str): 'numeric' (float64 values, NaN for missing), 'categorical' (raw values) or 
+                    'codes' (category codes over the union of the categories, -1 for missing; the feature must
+                    be categorical in every dataframe, or Arrow dictionary encoded with the same type in every dataframe)
+        
+    Returns:
+        (values, dataset_codes) (tuple): Concatenated feature values and int32 dataset codes
+    """
+    key = tuple(id(df) for df in dataframes) + (feature, kind)
+    columns = [df[feature] for df in dataframes]
+    with _PREPARED_CACHE_LOCK:
+        cached = _PREPARED_CACHE.get(key)
+        if cached is not None:
+            refs, cached_columns, values, dataset_codes = cached
+            same_data = True
+            for ref, df, cached_column, column in zip(refs, dataframes, cached_columns, columns):
+                if ref() is not df or _column_data_id(cached_column) != _column_data_id(column):
+                    same_data = False
+            if same_data:
+                _PREPARED_CACHE.move_to_end(key)
+                return values, dataset_codes
+
+    if kind == 'codes' and _is_arrow_dictionary(columns[0]):
+        values = _arrow_dictionary_codes(columns)
+    elif kind == 'codes':
+        # Recodes every categorical against the merged categories and concatenates the codes in one step
+        values = union_categoricals([column.array for column in columns]).codes
+    else:
+        arrays = []
+        for column in columns:
+            if kind == 'numeric' and not (isinstance(column.dtype, np.dtype) and column.dtype.kind in 'iuf'):
+                # Nullable/extension columns need a converted copy, NumPy numeric columns are used as views
+                arrays.append(column.to_numpy(dtype=np.float64, na_value=np.nan))
+            else:
+                arrays.append(column.to_numpy())
+        if kind == 'numeric':
+            # Casts to float64 while concatenating, so the result is the only float64 copy of the feature
+            values = np.concatenate(arrays, dtype=np.float64)
+        else:
+            values = np.concatenate(arrays)
+    dataset_codes = np.repeat(np.arange(len(columns), dtype=np.int32), [len(column) for column in columns])
+    values.flags.writeable = False
+    dataset_codes.flags.writeable = False
+
+    with _PREPARED_CACHE_LOCK:
+        _PREPARED_CACHE[key] = ([weakref.ref(df) for df in dataframes], columns, values, dataset_codes)
+        if len(_PREPARED_CACHE) > _PREPARED_CACHE_SIZE:
+            _PREPARED_CACHE.popitem(last=False)
+    return values, dataset_codes
 
 
 def compare_distributions_across_datasets(dataframes: list[pd.DataFrame],
                                             dataset_names: list[str],
                                             feature: str,
-                                            test_type: str = 'auto') -> dict:
+                                            test_type: str = 'auto',
+                                            engine: str = 'fast') -> TestResult:
     """
     Compare feature distribution across multiple datasets.
+    The feature columns are concatenated into one array alongside an array of dataset codes, so no intermediate
+    labelled dataframe is built. These arrays are cached per (dataframes, feature), see clear_prepared_cache.
+    The prepared arrays are already float64 with NaN for missing values and integer dataset codes, so numeric
+    features use the 'fast' engine (no scipy input validation) by default.
+    Categorical features that are pandas categoricals, or Arrow dictionary columns (dtype_backend='pyarrow'), 
+    are tested from their integer codes directly; other columns (e.g. object strings) are factorized first.
     
     Parameters:
         dataframes (list of pd.DataFrame): List of dataframes
         dataset_names (list of str): Names of datasets
         feature (str): Feature to compare
         test_type (str): 'auto', 'numeric', or 'categorical'
+        engine (str): 'fast' or 'scipy' for numeric features, see test_numeric_across_groups_arr
         
     Returns:
-        result (dict): Comparison results
+        result (TestResult): Comparison results
     """
-    # Combine with dataset labels
-    combined_data = []
-    for df, name in zip(dataframes, dataset_names):
-        temp = df[[feature]].copy()
-        temp['Dataset'] = name
-        combined_data.append(temp)
-    
-    df_combined = pd.concat(combined_data, ignore_index=True)
-    
+    if len(dataframes) != len(dataset_names):
+        raise ValueError("Number of dataframes must match number of dataset names")
+
     # Determine test type
     if test_type == 'auto':
-        if df_combined[feature].dtype in ['object', 'category']:
+        # Object, string and boolean columns (dtype kind) or categoricals are compared as categorical
+        dtype = dataframes[0][feature].dtype
+        if dtype.kind in 'OUb' or isinstance(dtype, pd.CategoricalDtype):
             test_type = 'categorical'
         else:
             test_type = 'numeric'
     
+    # Categorical and Arrow dictionary columns already carry integer codes, 
+    # so the contingency table is counted from those directly
+    if test_type == 'categorical':
+        # union_categoricals needs the categories of every dataframe to have the same dtype
+        first_dtype = dataframes[0][feature].dtype
+        all_categorical = isinstance(first_dtype, pd.CategoricalDtype)
+        all_arrow_dictionary = _is_arrow_dictionary(dataframes[0][feature])
+        for df in dataframes:
+            dtype = df[feature].dtype
+            if not isinstance(dtype, pd.CategoricalDtype):
+                all_categorical = False
+            elif all_categorical and dtype.categories.dtype != first_dtype.categories.dtype:
+                all_categorical = False
+            if not (_is_arrow_dictionary(df[feature]) and df[feature].dtype == dataframes[0][feature].dtype):
+                all_arrow_dictionary = False
+        if all_categorical or all_arrow_dictionary:
+            feature_codes, dataset_codes = _prepare_feature_arrays(dataframes, feature, 'codes')
+            observed = feature_codes >= 0
+            contingency = _contingency_table(dataset_codes[observed], 
+                                                feature_codes[observed], 
+                                                (len(dataframes), feature_codes.max() + 1))
+            return _chi_square_result(contingency, 'Dataset', feature)
+
+    # Combine the feature values, with the dataset code of each value in a parallel array
+    values, dataset_codes = _prepare_feature_arrays(dataframes, feature, test_type)
+    
     # Perform appropriate test
     if test_type == 'categorical':
-        result = test_categorical_independence(df_combined, 'Dataset', feature)
+        result = test_categorical_independence_arr(dataset_codes, values, 'Dataset', feature)
     else:
-        result = test_numeric_across_groups(df_combined, feature, 'Dataset')
+        result = test_numeric_across_groups_arr(values, dataset_codes, feature, 'Dataset', engine=engine)
     
-    return result
\ No newline at end of file
+    return result
+
+
+def compare_many(dataframes: list[pd.DataFrame],
+                    dataset_names: list[str],
+                    features: list[str],
+                    test_type: str = 'auto',
+                    n_workers: int | None = None,
+                    engine: str = 'fast') -> list[TestResult]:
+    """
+    Compare the distribution of several features across multiple datasets.
+    Each feature is compared in a thread pool (the NumPy/SciPy/numba work releases the GIL), sharing the 
+    dataframes and the cache of prepared arrays instead of copying them to worker processes.
+    
+    Parameters:
+        dataframes (list of pd.DataFrame): List of dataframes
+        dataset_names (list of str): Names of datasets
+        features (list of str): Features to compare
+        test_type (str): 'auto', 'numeric', or 'categorical'
+        n_workers (int): Number of threads (default: number of CPUs, at most one per feature)
+        engine (str): 'fast' or 'scipy' for numeric features, see test_numeric_across_groups_arr
+        
+    Returns:
+        results (list of TestResult): Comparison results, in the same order as features
+    """
+    def compare_feature(feature: str) -> TestResult:
+        return compare_distributions_across_datasets(dataframes, dataset_names, feature, test_type, engine)
+
+    if n_workers is None:
+        n_workers = min(len(features), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max(1, n_workers)) as executor:
+        results = list(executor.map(compare_feature, features))
+    return results
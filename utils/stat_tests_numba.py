@@ -0,0 +1,121 @@
+"""
+CVD Project Utilities: Numba kernels for the statistical tests
+==============================================================
+
+Compiled kernels used by stat_tests.py when numba is installed. Ranking the values and summing the ranks per group
+is fused into one pass over the sorted data, which avoids the interpreter/dispatch overhead of going through scipy
+for every feature when many features are tested one after the other. The kernels release the GIL, so features can
+also be tested in parallel threads.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, nogil=True)
+def _ranks_with_ties(sorted_values):
+    """
+    Assign ranks (starting at 1) to already sorted values, tied values get the average rank of their run.
+    The tie term sum(t^3 - t) of the tie correction is accumulated from the same runs.
+
+    Parameters:
+        sorted_values (np.ndarray): Values sorted in ascending order
+
+    Returns:
+        (ranks, tie_sum) (tuple): Rank of each sorted value (float64) and sum(t^3 - t) over the tie runs
+    """
+    n = sorted_values.shape[0]
+    ranks = np.empty(n, dtype=np.float64)
+    tie_sum = 0.0
+    start = 0
+    while start < n:
+        end = start + 1
+        while end < n and sorted_values[end] == sorted_values[start]:
+            end += 1
+        # Positions start..end-1 hold ranks start+1..end, so their average is (start + 1 + end) / 2
+        average_rank = (start + 1 + end) / 2.0
+        for i in range(start, end):
+            ranks[i] = average_rank
+        run_length = float(end - start)
+        tie_sum += run_length * run_length * run_length - run_length
+        start = end
+    return ranks, tie_sum
+
+
+@njit(cache=True, nogil=True)
+def _group_rank_sums(ranks, codes, n_groups):
+    """
+    Sum the ranks and count the observations of each group.
+
+    Parameters:
+        ranks (np.ndarray): Rank of each observation
+        codes (np.ndarray): Group code (0..k-1) of each observation, aligned with ranks
+        n_groups (int): Number of groups k
+
+    Returns:
+        (rank_sums, group_sizes) (tuple): Per-group rank sums and observation counts
+    """
+    rank_sums = np.zeros(n_groups, dtype=np.float64)
+    group_sizes = np.zeros(n_groups, dtype=np.int64)
+    for i in range(ranks.shape[0]):
+        rank_sums[codes[i]] += ranks[i]
+        group_sizes[codes[i]] += 1
+    return rank_sums, group_sizes
+
+
+@njit(cache=True, nogil=True)
+def kruskal_h_statistic(sorted_values, sort_order, codes):
+    """
+    Compute the (uncorrected for ties) Kruskal-Wallis H statistic and the tie term from sorted values.
+    The ranks are summed per group in sorted order (via sort_order), so they never need to be permuted back.
+
+    Parameters:
+        sorted_values (np.ndarray): Observations sorted in ascending order
+        sort_order (np.ndarray): Permutation that sorts the observations (argsort)
+        codes (np.ndarray): Group code (0..k-1) of each observation, in the original order
+
+    Returns:
+        (statistic, tie_sum) (tuple): H statistic and sum(t^3 - t) over the tie runs
+    """
+    n_total = sorted_values.shape[0]
+    n_groups = codes.max() + 1
+    ranks, tie_sum = _ranks_with_ties(sorted_values)
+    rank_sums, group_sizes = _group_rank_sums(ranks, codes[sort_order], n_groups)
+
+    total = 0.0
+    for g in range(n_groups):
+        if group_sizes[g] > 0:
+            total += rank_sums[g] * rank_sums[g] / group_sizes[g]
+    h_statistic = 12.0 / (n_total * (n_total + 1.0)) * total - 3.0 * (n_total + 1.0)
+    return h_statistic, tie_sum
+
+
+@njit(cache=True, nogil=True)
+def ranks_from_order(sort_order, values):
+    """
+    Assign ranks (starting at 1, ties get the average rank of their run) given a precomputed sort order, 
+    so the O(N log N) sort can be shared between several rank based computations on the same values.
+
+    Parameters:
+        sort_order (np.ndarray): Permutation that sorts values (argsort)
+        values (np.ndarray): Values to rank
+
+    Returns:
+        (ranks, tie_sum) (tuple): Rank of each value, in the original order (float64), 
+                                  and sum(t^3 - t) over the tie runs
+    """
+    n = sort_order.shape[0]
+    ranks = np.empty(n, dtype=np.float64)
+    tie_sum = 0.0
+    start = 0
+    while start < n:
+        end = start + 1
+        while end < n and values[sort_order[end]] == values[sort_order[start]]:
+            end += 1
+        average_rank = (start + 1 + end) / 2.0
+        for i in range(start, end):
+            ranks[sort_order[i]] = average_rank
+        run_length = float(end - start)
+        tie_sum += run_length * run_length * run_length - run_length
+        start = end
+    return ranks, tie_sum